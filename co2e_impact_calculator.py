@@ -35,20 +35,20 @@ Home Energy:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from decimal import Decimal
 import webbrowser
 
+import numpy as np
+
 
 # =============================================================================
 # SCIENTIFIC CONSTANTS
 # =============================================================================
 
-# Mortality Cost of Carbon (MCC) from Bressler (2021), Nature Communications
-MCC_CENTRAL = Decimal("0.000226")  # deaths per metric ton CO2e
-MCC_LOW = Decimal("-0.000171")     # lower bound
-MCC_HIGH = Decimal("0.000678")     # upper bound
+# Mortality Cost of Carbon (MCC) from Bressler (2021), Nature Communications:
+# [central estimate, lower bound, upper bound] in deaths per metric ton CO2e
+MCC = np.array([0.000226, -0.000171, 0.000678], dtype=np.float64)
 
-KG_PER_METRIC_TON = Decimal("1000")
+KG_PER_METRIC_TON = 1000.0
 PROJECTION_YEARS = 10  # User's commitment period
 
 
@@ -147,18 +147,48 @@ LIFESTYLE_CHANGES = [
     },
 ]
 
+# Structure-of-arrays view of the annual savings, so selection totals are a
+# single vectorized reduction instead of a per-dict Python loop
+ANNUAL_KG = np.array([c["annual_kg"] for c in LIFESTYLE_CHANGES], dtype=np.int32)
+
+
+# =============================================================================
+# RESULT TEXT TEMPLATES
+# =============================================================================
+
+# Pre-built templates filled via str.format_map with a single values dict
+# on each Calculate click
+
+RANGE_TPL = "(Range: {low:.6f} to {high:.6f})"
+ANNUAL_TPL = "Annual CO2e savings: {a:,} kg ({at:.2f} metric tons)"
+TEN_YEAR_TPL = "10-Year CO2e savings: {t:,} kg ({tt:.2f} metric tons)"
+
+# Interpretation buckets: first entry whose threshold the central estimate
+# meets wins; the -inf entry is the catch-all
+INTERPRETATION_TPLS = (
+    (1, "Your commitment could prevent approximately {c:.1f} premature deaths "
+        "from temperature-related causes over the next ~80 years."),
+    (0.1, "Your commitment represents about {pct:.1f}% of preventing one "
+          "premature death from climate-related temperature stress."),
+    (0.01, "Your commitment represents about {pct:.2f}% of preventing one "
+           "premature death. Every contribution matters!"),
+    (float("-inf"), "If {n:,} people made these same commitments, together you would "
+                    "prevent approximately 1 premature death from climate change."),
+)
+
 
 # =============================================================================
 # CALCULATION FUNCTIONS
 # =============================================================================
 
-def calculate_lives_saved(co2e_kg: Decimal) -> dict:
+def calculate_lives_saved(co2e_kg: float) -> dict:
     """Calculate estimated lives saved from CO2e reduction."""
     co2e_tons = co2e_kg / KG_PER_METRIC_TON
+    central, low, high = co2e_tons * MCC
     return {
-        "central": co2e_tons * MCC_CENTRAL,
-        "low": co2e_tons * MCC_LOW,
-        "high": co2e_tons * MCC_HIGH,
+        "central": central,
+        "low": low,
+        "high": high,
         "co2e_tons": co2e_tons
     }
 
@@ -176,8 +206,13 @@ class CO2eImpactCalculator:
         self.root.geometry("800x900")
         self.root.minsize(700, 800)
 
-        # Track selected changes
-        self.change_vars = {}
+        # Track selected changes: one BooleanVar per change in declaration
+        # order, with a dict view by id kept for back-compat
+        self.vars_list = [tk.BooleanVar(value=False) for _ in LIFESTYLE_CHANGES]
+        self.change_vars = {
+            change["id"]: var
+            for change, var in zip(LIFESTYLE_CHANGES, self.vars_list)
+        }
 
         # Configure styles
         self.style = ttk.Style()
@@ -188,8 +223,25 @@ class CO2eImpactCalculator:
         self.style.configure("BigResult.TLabel", font=("Helvetica", 24, "bold"))
         self.style.configure("Info.TLabel", font=("Helvetica", 10))
         self.style.configure("Small.TLabel", font=("Helvetica", 9))
+        self.style.configure("CardName.TLabel", font=("Helvetica", 11, "bold"))
+        self.style.configure("CardSavings.TLabel", foreground="green", font=("Helvetica", 10, "bold"))
+        self.style.configure("BigTotal.TLabel", font=("Helvetica", 11, "bold"))
+        self.style.configure("Caveat.TLabel", foreground="gray", font=("Helvetica", 9, "italic"))
+        self.style.configure("Link.TLabel", foreground="blue", font=("Helvetica", 10, "underline"))
+
+        # One canvas per tab, filled in by the tab builders; a single
+        # app-level wheel handler dispatches to whichever tab is visible
+        self._canvases = [None, None, None]
 
         self._create_widgets()
+        self._update_summary()
+
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
+    def _on_mousewheel(self, event):
+        """Scroll the canvas of the currently visible tab."""
+        canvas = self._canvases[self.notebook.index("current")]
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -245,19 +297,17 @@ class CO2eImpactCalculator:
 
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self._canvases[0] = canvas
 
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Create checkbox for each lifestyle change
+        # Create a card for each lifestyle change; suppress geometry
+        # propagation while they are added so the frame reflows once
+        self.scrollable_frame.pack_propagate(False)
         for i, change in enumerate(LIFESTYLE_CHANGES):
             self._create_change_card(change, i)
+        self.scrollable_frame.pack_propagate(True)
 
         # Summary and calculate button at bottom
         bottom_frame = ttk.Frame(self.selection_frame)
@@ -278,42 +328,41 @@ class CO2eImpactCalculator:
         calc_btn.pack(side=tk.RIGHT)
 
     def _create_change_card(self, change: dict, index: int):
-        """Create a card for a single lifestyle change option."""
-        # Card frame
+        """Create a card for a single lifestyle change option.
+
+        The card is a single flat frame laid out with grid (checkbox,
+        name, and savings on row 0; description and source below) so Tk
+        runs one geometry pass per card instead of nested pack recalcs.
+        """
         card = ttk.Frame(self.scrollable_frame, relief="groove", padding="10")
         card.pack(fill=tk.X, pady=5, padx=5)
+        card.columnconfigure(1, weight=1)
 
         # Checkbox variable
-        var = tk.BooleanVar(value=False)
-        self.change_vars[change["id"]] = var
-
-        # Top row: checkbox + name + annual savings
-        top_row = ttk.Frame(card)
-        top_row.pack(fill=tk.X)
+        var = self.vars_list[index]
 
         cb = ttk.Checkbutton(
-            top_row,
+            card,
             variable=var,
             command=self._update_summary
         )
-        cb.pack(side=tk.LEFT)
+        cb.grid(row=0, column=0)
 
         name_label = ttk.Label(
-            top_row,
+            card,
             text=change["name"],
-            font=("Helvetica", 11, "bold"),
+            style="CardName.TLabel",
             cursor="hand2"
         )
-        name_label.pack(side=tk.LEFT, padx=(5, 10))
+        name_label.grid(row=0, column=1, sticky="w", padx=(5, 10))
         name_label.bind("<Button-1>", lambda e, v=var: v.set(not v.get()) or self._update_summary())
 
         savings_label = ttk.Label(
-            top_row,
+            card,
             text=f"{change['annual_kg']:,} kg CO2e/year",
-            foreground="green",
-            font=("Helvetica", 10, "bold")
+            style="CardSavings.TLabel"
         )
-        savings_label.pack(side=tk.RIGHT)
+        savings_label.grid(row=0, column=2, sticky="e")
 
         # Description
         desc_label = ttk.Label(
@@ -324,7 +373,7 @@ class CO2eImpactCalculator:
             style="Small.TLabel",
             foreground="gray"
         )
-        desc_label.pack(fill=tk.X, padx=(25, 0), pady=(5, 0))
+        desc_label.grid(row=1, column=1, columnspan=2, sticky="ew", pady=(5, 0))
 
         # Source
         source_label = ttk.Label(
@@ -333,65 +382,38 @@ class CO2eImpactCalculator:
             style="Small.TLabel",
             foreground="blue"
         )
-        source_label.pack(anchor=tk.W, padx=(25, 0))
+        source_label.grid(row=2, column=1, columnspan=2, sticky="w")
 
     def _update_summary(self):
         """Update the summary label with current selections."""
-        selected = []
-        total_annual = 0
-
-        for change in LIFESTYLE_CHANGES:
-            if self.change_vars[change["id"]].get():
-                selected.append(change)
-                total_annual += change["annual_kg"]
-
+        mask = np.fromiter(
+            (var.get() for var in self.vars_list),
+            dtype=bool,
+            count=len(self.vars_list)
+        )
+        total_annual = int((ANNUAL_KG * mask).sum())
         total_10y = total_annual * PROJECTION_YEARS
 
+        # Cache so _calculate_and_show_results doesn't re-scan the vars
+        self._selected_mask = mask
+        self._total_annual = total_annual
+
         self.summary_label.config(
-            text=f"Selected: {len(selected)} changes | "
+            text=f"Selected: {int(mask.sum())} changes | "
                  f"Annual savings: {total_annual:,} kg CO2e | "
                  f"10-year total: {total_10y:,} kg CO2e"
         )
 
     def _create_results_tab(self):
-        """Create the results display interface."""
-        # This will be populated when calculate is clicked
+        """Create the results display interface.
+
+        The full layout is built once here; `_calculate_and_show_results`
+        only updates label text and toggles the per-change rows, avoiding
+        a widget rebuild on every Calculate click.
+        """
         self.results_content = ttk.Frame(self.results_tab)
         self.results_content.pack(fill=tk.BOTH, expand=True)
 
-        placeholder = ttk.Label(
-            self.results_content,
-            text="Select lifestyle changes in Step 1, then click 'Calculate Lives Saved'",
-            style="Subtitle.TLabel"
-        )
-        placeholder.pack(expand=True)
-
-    def _calculate_and_show_results(self):
-        """Calculate impact and display results."""
-        # Gather selected changes
-        selected = []
-        for change in LIFESTYLE_CHANGES:
-            if self.change_vars[change["id"]].get():
-                selected.append(change)
-
-        if not selected:
-            messagebox.showwarning(
-                "No Selection",
-                "Please select at least one lifestyle change to calculate impact."
-            )
-            return
-
-        # Calculate totals
-        total_annual = sum(c["annual_kg"] for c in selected)
-        total_10y = total_annual * PROJECTION_YEARS
-
-        # Calculate lives saved
-        results = calculate_lives_saved(Decimal(total_10y))
-
-        # Clear and rebuild results tab
-        for widget in self.results_content.winfo_children():
-            widget.destroy()
-
         # Create scrollable results
         canvas = tk.Canvas(self.results_content, highlightthickness=0)
         scrollbar = ttk.Scrollbar(self.results_content, orient="vertical", command=canvas.yview)
@@ -404,6 +426,7 @@ class CO2eImpactCalculator:
 
         canvas.create_window((0, 0), window=results_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+        self._canvases[1] = canvas
 
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -417,7 +440,6 @@ class CO2eImpactCalculator:
         header.pack(pady=(0, 20))
 
         # Big number: Lives saved
-        central = float(results["central"])
         lives_frame = ttk.Frame(results_frame)
         lives_frame.pack(pady=10)
 
@@ -427,24 +449,16 @@ class CO2eImpactCalculator:
             style="Section.TLabel"
         ).pack()
 
-        if central >= 0.01:
-            lives_text = f"{central:.4f}"
-        else:
-            lives_text = f"{central:.6f}"
-
-        lives_label = ttk.Label(
+        self.lives_label = ttk.Label(
             lives_frame,
-            text=lives_text,
+            text="",
             style="BigResult.TLabel",
             foreground="green"
         )
-        lives_label.pack()
+        self.lives_label.pack()
 
-        # Uncertainty range
-        low = float(results["low"])
-        high = float(results["high"])
-        range_text = f"(Range: {low:.6f} to {high:.6f})"
-        ttk.Label(lives_frame, text=range_text, style="Small.TLabel").pack()
+        self.range_label = ttk.Label(lives_frame, text="", style="Small.TLabel")
+        self.range_label.pack()
 
         # CO2e summary
         ttk.Separator(results_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15, padx=20)
@@ -452,25 +466,24 @@ class CO2eImpactCalculator:
         co2_frame = ttk.LabelFrame(results_frame, text="CO2e Savings Breakdown", padding="15")
         co2_frame.pack(fill=tk.X, padx=20, pady=10)
 
-        ttk.Label(
-            co2_frame,
-            text=f"Annual CO2e savings: {total_annual:,} kg ({total_annual/1000:.2f} metric tons)",
-            style="Info.TLabel"
-        ).pack(anchor=tk.W)
+        self.annual_co2_label = ttk.Label(co2_frame, text="", style="Info.TLabel")
+        self.annual_co2_label.pack(anchor=tk.W)
 
-        ttk.Label(
+        self.ten_year_label = ttk.Label(
             co2_frame,
-            text=f"10-Year CO2e savings: {total_10y:,} kg ({total_10y/1000:.2f} metric tons)",
-            font=("Helvetica", 11, "bold")
-        ).pack(anchor=tk.W, pady=(5, 0))
+            text="",
+            style="BigTotal.TLabel"
+        )
+        self.ten_year_label.pack(anchor=tk.W, pady=(5, 0))
 
-        # Selected changes breakdown
+        # Selected changes breakdown: one pre-built row per change, shown
+        # or hidden depending on the selection
         changes_frame = ttk.LabelFrame(results_frame, text="Your Committed Changes", padding="15")
         changes_frame.pack(fill=tk.X, padx=20, pady=10)
 
-        for change in selected:
+        self.change_rows = []
+        for change in LIFESTYLE_CHANGES:
             row = ttk.Frame(changes_frame)
-            row.pack(fill=tk.X, pady=2)
 
             ttk.Label(row, text="✓", foreground="green").pack(side=tk.LEFT)
             ttk.Label(row, text=change["name"], style="Info.TLabel").pack(side=tk.LEFT, padx=(5, 10))
@@ -480,38 +493,19 @@ class CO2eImpactCalculator:
                 foreground="gray"
             ).pack(side=tk.RIGHT)
 
+            self.change_rows.append(row)
+
         # Interpretation
         interp_frame = ttk.LabelFrame(results_frame, text="What This Means", padding="15")
         interp_frame.pack(fill=tk.X, padx=20, pady=10)
 
-        if central >= 1:
-            interpretation = (
-                f"Your commitment could prevent approximately {central:.1f} premature deaths "
-                f"from temperature-related causes over the next ~80 years."
-            )
-        elif central >= 0.1:
-            interpretation = (
-                f"Your commitment represents about {central*100:.1f}% of preventing one "
-                f"premature death from climate-related temperature stress."
-            )
-        elif central >= 0.01:
-            interpretation = (
-                f"Your commitment represents about {central*100:.2f}% of preventing one "
-                f"premature death. Every contribution matters!"
-            )
-        else:
-            people_needed = int(1 / central) if central > 0 else 0
-            interpretation = (
-                f"If {people_needed:,} people made these same commitments, together you would "
-                f"prevent approximately 1 premature death from climate change."
-            )
-
-        ttk.Label(
+        self.interp_label = ttk.Label(
             interp_frame,
-            text=interpretation,
+            text="",
             wraplength=650,
             justify=tk.LEFT
-        ).pack(anchor=tk.W)
+        )
+        self.interp_label.pack(anchor=tk.W)
 
         # Caveat
         caveat_text = (
@@ -519,14 +513,75 @@ class CO2eImpactCalculator:
             "It does NOT include deaths from storms, floods, crop failures, infectious diseases, "
             "or conflict. The actual total lives saved is likely HIGHER than shown."
         )
-        ttk.Label(
+        self.caveat_label = ttk.Label(
             interp_frame,
             text=caveat_text,
             wraplength=650,
             justify=tk.LEFT,
-            foreground="gray",
-            font=("Helvetica", 9, "italic")
-        ).pack(anchor=tk.W, pady=(10, 0))
+            style="Caveat.TLabel"
+        )
+        self.caveat_label.pack(anchor=tk.W, pady=(10, 0))
+
+    def _calculate_and_show_results(self):
+        """Calculate impact and display results."""
+        # Selection mask and total are kept up to date by _update_summary
+        mask = self._selected_mask
+        total_annual = self._total_annual
+        selected = [LIFESTYLE_CHANGES[i] for i in np.nonzero(mask)[0]]
+
+        if not selected:
+            messagebox.showwarning(
+                "No Selection",
+                "Please select at least one lifestyle change to calculate impact."
+            )
+            return
+
+        # Calculate totals
+        total_10y = total_annual * PROJECTION_YEARS
+
+        # Calculate lives saved
+        results = calculate_lives_saved(float(total_10y))
+
+        # One values dict feeds every template below
+        central = results["central"]
+        values = {
+            "c": central,
+            "pct": central * 100,
+            "n": int(1 / central) if central > 0 else 0,
+            "low": results["low"],
+            "high": results["high"],
+            "a": total_annual,
+            "at": total_annual / 1000,
+            "t": total_10y,
+            "tt": total_10y / 1000,
+        }
+
+        # Big number: Lives saved
+        if central >= 0.01:
+            lives_text = f"{central:.4f}"
+        else:
+            lives_text = f"{central:.6f}"
+        self.lives_label.config(text=lives_text)
+
+        # Uncertainty range
+        self.range_label.config(text=RANGE_TPL.format_map(values))
+
+        # CO2e summary
+        self.annual_co2_label.config(text=ANNUAL_TPL.format_map(values))
+        self.ten_year_label.config(text=TEN_YEAR_TPL.format_map(values))
+
+        # Show only the rows for the selected changes; forget everything
+        # first so re-packed rows keep their declaration order
+        for row in self.change_rows:
+            row.pack_forget()
+        for i in np.nonzero(mask)[0]:
+            self.change_rows[i].pack(fill=tk.X, pady=2)
+
+        # Interpretation
+        for threshold, tpl in INTERPRETATION_TPLS:
+            if central >= threshold:
+                self.interp_label.config(text=tpl.format_map(values))
+                break
 
         # Switch to results tab
         self.notebook.select(1)
@@ -545,6 +600,7 @@ class CO2eImpactCalculator:
 
         canvas.create_window((0, 0), window=method_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+        self._canvases[2] = canvas
 
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -589,9 +645,8 @@ The MCC was derived by:
         link = ttk.Label(
             link_frame,
             text="Bressler (2021) - Nature Communications",
-            foreground="blue",
-            cursor="hand2",
-            font=("Helvetica", 10, "underline")
+            style="Link.TLabel",
+            cursor="hand2"
         )
         link.pack(side=tk.LEFT)
         link.bind("<Button-1>", lambda e: webbrowser.open(